@@ -1,33 +1,61 @@
 import tkinter as tk
 import cv2
+import numpy as np
 from PIL import Image, ImageTk
-import pigpio
+import os
+import sys
+import signal
+import atexit
 import threading
 import time
 
+# pigpio is only needed when driving the servo; --no-servo runs without it
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
+# Servo configuration
+GRIPPER_PIN = 17
+OPEN_PW = 2000   # Pulse width for open position (μs)
+CLOSED_PW = 1000  # Pulse width for closed position (μs)
+SERVO_STEP = 20  # Step size for gradual movement (μs)
+SERVO_INTERVAL = 50  # Interval between steps (ms)
+READOUT_INTERVAL = 100  # Interval between gripper readout refreshes (ms)
+
+# Pulse width change per step for each gripper button (CCW opens, CW closes)
+GRIPPER_ACTIONS = {
+    (group_name, "B3", direction): SERVO_STEP if direction == "CCW" else -SERVO_STEP
+    for group_name in ("BLACK", "BLUE")
+    for direction in ("CCW", "CW")
+}
+
+# Real-time settings for the motion thread (needs root or CAP_SYS_NICE)
+MOTION_CPU = 3  # Core reserved for servo stepping on a Pi 4
+MOTION_PRIORITY = 50  # SCHED_FIFO priority
+
+# Camera preview size (width, height)
+DISPLAY_SIZE = (600, 450)
+
 class RoboticArmGUI:
-    def __init__(self, root):
+    def __init__(self, root, use_servo=True):
         self.root = root
         self.root.title("Robotic Arm Control GUI")
         self.root.geometry("1000x600")
 
-        # Servo configuration
-        self.GRIPPER_PIN = 17
-        self.OPEN_PW = 2000   # Pulse width for open position (μs)
-        self.CLOSED_PW = 1000  # Pulse width for closed position (μs)
-        self.SERVO_STEP = 20  # Step size for gradual movement (μs)
-        self.SERVO_INTERVAL = 50  # Interval between steps (ms)
-        
-        # Initialize pigpio
-        self.pi = pigpio.pi()
-        if not self.pi.connected:
-            print("Failed to connect to pigpio daemon!")
-            # Show error in GUI
-            tk.messagebox.showerror("Connection Error", "Failed to connect to pigpio daemon!")
-
         # Set gripper to middle position initially
         self.current_pw = 1500
-        self.pi.set_servo_pulsewidth(self.GRIPPER_PIN, self.current_pw)
+
+        # Initialize pigpio (without it the buttons only update the display)
+        self.pi = None
+        if use_servo:
+            self.pi = pigpio.pi()
+            if not self.pi.connected:
+                print("Failed to connect to pigpio daemon!")
+                # Show error in GUI
+                tk.messagebox.showerror("Connection Error", "Failed to connect to pigpio daemon!")
+
+            self.pi.set_servo_pulsewidth(GRIPPER_PIN, self.current_pw)
 
         # Configure grid layout
         self.root.grid_columnconfigure(0, weight=3) # Camera display
@@ -49,11 +77,21 @@ class RoboticArmGUI:
         self.status_label = tk.Label(self.controls_frame, text="Robotic Arm Status:", font=("Arial", 14), bg="#f0f0f0")
         self.status_label.pack(pady=(20, 10))
 
-        self.servo_status = tk.Label(self.controls_frame, text="No servo activated", font=("Arial", 12), bg="white",
+        self.servo_text = tk.StringVar(value="No servo activated")
+        self.servo_status = tk.Label(self.controls_frame, textvariable=self.servo_text, font=("Arial", 12), bg="white",
                                   width=25, height=2, relief=tk.SUNKEN)
-        self.servo_status.pack(pady=(0, 20))
+        self.servo_status.pack(pady=(0, 10))
 
-        # Servo control buttons
+        # Gripper position readout, refreshed by the UI poller
+        self.gripper_text = tk.StringVar(value=f"Gripper: {self.current_pw}μs")
+        self.gripper_label = tk.Label(self.controls_frame, textvariable=self.gripper_text,
+                                      font=("Arial", 11), bg="#f0f0f0")
+        self.gripper_label.pack(pady=(0, 10))
+
+        # Servo control buttons share one class binding; each widget maps to its button id
+        self._button_ids = {}
+        self.root.bind_class("ServoButton", "<ButtonPress-1>", self._on_press)
+        self.root.bind_class("ServoButton", "<ButtonRelease-1>", self._on_release)
         self.create_button_frame("BLACK", ["B1", "B2", "B3"], "#333333", "white")
         self.create_button_frame("BLUE", ["B1", "B2", "B3"], "#3366cc", "white")
 
@@ -63,6 +101,28 @@ class RoboticArmGUI:
         # Camera failure flag
         self.camera_failed = False
 
+        # Single-slot mailbox filled by the camera grab thread
+        self._frame_lock = threading.Lock()
+        self._latest_frame = None
+        self._camera_stop = threading.Event()
+        self.camera_thread = None
+
+        # Preview image reused for every frame; frames are pasted into it
+        self.preview_photo = ImageTk.PhotoImage('RGB', DISPLAY_SIZE)
+
+        # RGB buffer the colour conversion writes into, so frames allocate nothing
+        self._rgb_buf = np.empty((DISPLAY_SIZE[1], DISPLAY_SIZE[0], 3), dtype=np.uint8)
+
+        # One persistent thread steps the gripper while its buttons are held
+        self._motion_wake = threading.Event()
+        self._motion_stop = threading.Event()
+        self._motion_thread = threading.Thread(target=self._motion_loop, daemon=True)
+        self._motion_thread.start()
+
+        # Last text shown by the UI poller, so unchanged values skip the redraw
+        self._last_shown = self.gripper_text.get()
+        self.root.after(READOUT_INTERVAL, self._ui_tick)
+
         # Initialize camera
         self.init_camera()
 
@@ -88,53 +148,123 @@ class RoboticArmGUI:
                                font=("Arial", 10, "bold"), width=3, height=2)
             left_btn.pack(side=tk.LEFT, padx=2)
             
-            # Bind mouse events to the left button
-            button_id = f"{group_name} {name} CCW"
-            # Use lambda with default arguments to avoid late binding issues
-            left_btn.bind("<ButtonPress-1>", lambda event, bid=button_id: self.button_press(bid))
-            left_btn.bind("<ButtonRelease-1>", lambda event, bid=button_id: self.button_release(bid))
+            # Route mouse events on the left button through the ServoButton binding
+            self._button_ids[left_btn] = (group_name, name, "CCW")
+            left_btn.bindtags(left_btn.bindtags() + ("ServoButton",))
             
             # Right button (clockwise)
             right_btn = tk.Button(button_frame, text="→", bg=bg_color, fg=fg_color,
                                font=("Arial", 10, "bold"), width=3, height=2)
             right_btn.pack(side=tk.LEFT, padx=2)
             
-            # Bind mouse events to the right button
-            button_id = f"{group_name} {name} CW"
-            right_btn.bind("<ButtonPress-1>", lambda event, bid=button_id: self.button_press(bid))
-            right_btn.bind("<ButtonRelease-1>", lambda event, bid=button_id: self.button_release(bid))
+            # Route mouse events on the right button through the ServoButton binding
+            self._button_ids[right_btn] = (group_name, name, "CW")
+            right_btn.bindtags(right_btn.bindtags() + ("ServoButton",))
+
+    def _on_press(self, event):
+        self.button_press(self._button_ids[event.widget])
+
+    def _on_release(self, event):
+        self.button_release(self._button_ids[event.widget])
 
     def button_press(self, button_id):
+        # Button ids are (group, name, direction) tuples
+        group_name, name, direction = button_id
+
         # Mark button as pressed
         self.button_states[button_id] = True
         
         # Update status display
-        self.servo_status.config(text=f"Activated: {button_id}")
+        self.servo_text.set(f"Activated: {group_name} {name} {direction}")
         
         # Print information
-        print(f"{button_id}")
+        print(f"{group_name} {name} {direction}")
         
         # Start continuous movement for the gripper
-        if "BLACK B3" in button_id or "BLUE B3" in button_id:
-            self.move_servo_continuously(button_id)
-
-    def move_servo_continuously(self, button_id):
-        # Only proceed if button is still pressed
-        if button_id in self.button_states and self.button_states[button_id]:
-            # Determine direction
-            if "CCW" in button_id:  # Open gripper
-                new_pw = min(self.current_pw + self.SERVO_STEP, self.OPEN_PW)
-            else:  # Close gripper
-                new_pw = max(self.current_pw - self.SERVO_STEP, self.CLOSED_PW)
-            
-            # Update position if it changed
-            if new_pw != self.current_pw:
-                self.current_pw = new_pw
-                self.pi.set_servo_pulsewidth(self.GRIPPER_PIN, self.current_pw)
-                print(f"Gripper position: {self.current_pw}μs")
-            
-            # Schedule the next movement only if button is still pressed
-            self.root.after(self.SERVO_INTERVAL, lambda: self.move_servo_continuously(button_id))
+        if button_id in GRIPPER_ACTIONS:
+            self._motion_wake.set()
+
+    def _raise_thread_priority(self):
+        """Pin the calling thread to the motion core and switch it to SCHED_FIFO"""
+        try:
+            os.sched_setaffinity(0, {MOTION_CPU})
+        except (AttributeError, OSError) as e:
+            print(f"Could not pin motion thread to CPU {MOTION_CPU}: {e}")
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(MOTION_PRIORITY))
+        except (AttributeError, OSError) as e:
+            print(f"Could not enable SCHED_FIFO for motion thread: {e}")
+
+    def _motion_loop(self):
+        self._raise_thread_priority()
+
+        interval = SERVO_INTERVAL / 1000
+
+        # Bind loop invariants locally so each tick skips global and attribute lookups
+        states = self.button_states
+        wake = self._motion_wake
+        stop = self._motion_stop
+        if self.pi is not None:
+            set_pw = self.pi.set_servo_pulsewidth
+        else:
+            set_pw = lambda pin, pw: None
+        actions = GRIPPER_ACTIONS
+        pin = GRIPPER_PIN
+        open_pw = OPEN_PW
+        closed_pw = CLOSED_PW
+
+        while not stop.is_set():
+            # Idle until a gripper button is pressed
+            wake.wait()
+            wake.clear()
+            next_t = time.monotonic()
+
+            # Service every held gripper button on one shared cadence
+            while not stop.is_set():
+                held = False
+                for button_id, pressed in list(states.items()):
+                    delta = actions.get(button_id)
+                    if not pressed or delta is None:
+                        continue
+                    held = True
+
+                    # Step towards open or closed, clamped to the gripper limits
+                    current_pw = self.current_pw
+                    new_pw = min(max(current_pw + delta, closed_pw), open_pw)
+
+                    # Update position if it changed
+                    if new_pw != current_pw:
+                        self.current_pw = new_pw
+                        set_pw(pin, new_pw)
+
+                if not held:
+                    break
+
+                # Sleep until just before the absolute deadline, then spin the rest;
+                # waiting on the stop event lets cleanup end the sleep at once
+                next_t += interval
+                now = time.monotonic()
+
+                # After an overrun, restart the cadence from now instead of
+                # firing a burst of catch-up steps
+                if next_t < now:
+                    next_t = now
+
+                remaining = next_t - now - 0.0005
+                if remaining > 0 and stop.wait(remaining):
+                    break
+                while time.monotonic() < next_t:
+                    pass
+
+    def _ui_tick(self):
+        # Refresh the position readout at 10 Hz, which is as fast as anyone can read it
+        text = f"Gripper: {self.current_pw}μs"
+        if text != self._last_shown:
+            self.gripper_text.set(text)
+            self._last_shown = text
+
+        self.root.after(READOUT_INTERVAL, self._ui_tick)
 
     def button_release(self, button_id):
         # Check if this button was active
@@ -143,44 +273,86 @@ class RoboticArmGUI:
             self.button_states[button_id] = False
             
             # Print release information
-            print(f"RELEASED: {button_id}")
+            print(f"RELEASED: {' '.join(button_id)}")
             
             # Remove from button states
             del self.button_states[button_id]
             
             # Update status to show no active servo
             if not self.button_states:
-                self.servo_status.config(text="No servo activated")
-
-    def get_current_pw(self, pin):
-        """Get current pulse width or return middle position if servo is off"""
-        current_pw = self.pi.get_servo_pulsewidth(pin)
-        if current_pw == 0:  # If servo is off
-            return 1500  # Return middle position
-        return current_pw
+                self.servo_text.set("No servo activated")
 
     def init_camera(self):
         try:
-            # Explicitly release any existing camera first
-            if hasattr(self, 'cap') and self.cap is not None:
-                self.cap.release()
-                time.sleep(0.5)  # Give the camera time to close properly
+            # Stop any existing grab thread first; it releases its camera as it exits
+            if self.camera_thread is not None:
+                self._camera_stop.set()
+
+                # Poll for it to finish rather than joining, so a slow read never blocks the UI
+                if self.camera_thread.is_alive():
+                    self.root.after(50, self.init_camera)
+                    return
+                self.camera_thread = None
+
+                # Give the camera time to close properly without blocking the UI
+                self.root.after(500, self.init_camera)
+                return
             
             # Try to connect to camera (0 is usually the default webcam)
-            self.cap = cv2.VideoCapture(0)
+            cap = cv2.VideoCapture(0)
             
-            if not self.cap.isOpened():
+            if not cap.isOpened():
+                cap.release()
                 self.handle_camera_failure()
             else:
-                # If camera is available, update frames
+                # Ask the camera for the display size so frames need no resampling
+                cap.set(cv2.CAP_PROP_FRAME_WIDTH, DISPLAY_SIZE[0])
+                cap.set(cv2.CAP_PROP_FRAME_HEIGHT, DISPLAY_SIZE[1])
+
+                # Drop the failure overlay left by an earlier attempt
+                if hasattr(self, 'text_label'):
+                    self.text_label.destroy()
+                    del self.text_label
+
+                # If camera is available, grab frames in the background and display them
                 self.camera_failed = False
+                self.camera_label.config(image=self.preview_photo)
+                self.camera_label.image = self.preview_photo
+                self._latest_frame = None
+
+                # The grab thread owns the camera from here on. It gets its own stop event,
+                # so one that outlived its join timeout can't be revived by the next start
+                self._camera_stop = threading.Event()
+                self.camera_thread = threading.Thread(target=self._grab_loop,
+                                                      args=(cap, self._camera_stop), daemon=True)
+                self.camera_thread.start()
                 self.update_camera()
         except Exception as e:
             print(f"Camera initialization error: {e}")
             self.handle_camera_failure()
 
+    def _grab_loop(self, cap, stop):
+        # cap.read() blocks at the camera's own frame rate; keep only the newest frame
+        try:
+            while not stop.is_set():
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                with self._frame_lock:
+                    self._latest_frame = frame
+        finally:
+            # Released here, never from the Tk thread, so it can't race a read in progress
+            cap.release()
+
+    def _stop_grab_thread(self):
+        self._camera_stop.set()
+        if self.camera_thread is not None:
+            self.camera_thread.join(timeout=1)
+            self.camera_thread = None
+
     def handle_camera_failure(self):
         self.camera_failed = True
+        self._camera_stop.set()
         # If no camera is available, show a placeholder
         placeholder = Image.new('RGB', (640, 480), color='darkgray')
         self.photo = ImageTk.PhotoImage(placeholder)
@@ -199,6 +371,8 @@ class RoboticArmGUI:
         self.camera_label.bind("<Button-1>", lambda e: self.retry_camera())
 
     def retry_camera(self):
+        # Ignore further clicks until this attempt has succeeded or failed again
+        self.camera_label.unbind("<Button-1>")
         print("Attempting to reconnect to camera...")
         self.init_camera()
 
@@ -207,66 +381,109 @@ class RoboticArmGUI:
             return
             
         try:
-            ret, frame = self.cap.read()
-            if ret:
-                # Convert from BGR (OpenCV format) to RGB (PIL format)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # Take the newest frame from the grab thread, if one arrived since the last tick
+            with self._frame_lock:
+                frame = self._latest_frame
+                self._latest_frame = None
+
+            if frame is not None:
+                # Resize only if the camera ignored the requested size, before the colour copy
+                if frame.shape[1::-1] != DISPLAY_SIZE:
+                    frame = cv2.resize(frame, DISPLAY_SIZE, interpolation=cv2.INTER_AREA)
                 
-                # Convert to PIL Image and then to Tkinter PhotoImage
-                image = Image.fromarray(frame)
-                # Resize to fit our display if needed
-                image = image.resize((600, 450), Image.LANCZOS)
-                self.photo = ImageTk.PhotoImage(image)
+                # Convert from BGR (OpenCV format) to RGB (PIL format) in place
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
                 
-                # Update the label
-                self.camera_label.config(image=self.photo)
-                self.camera_label.image = self.photo # Keep a reference
-            else:
+                # Wrap the RGB buffer directly
+                image = Image.frombuffer('RGB', DISPLAY_SIZE, self._rgb_buf, 'raw', 'RGB', 0, 1)
+                
+                # Copy the pixels into the preview image the label already shows
+                self.preview_photo.paste(image)
+            elif not self.camera_thread.is_alive():
                 print("Failed to get frame from camera")
                 self.handle_camera_failure()
                 return
             
-            # Update every 10ms (approximately 100 fps max)
-            self.root.after(10, self.update_camera)
+            # Check for a new frame at ~30 fps
+            self.root.after(33, self.update_camera)
         except Exception as e:
             print(f"Camera update error: {e}")
             self.handle_camera_failure()
 
     def cleanup(self):
+        """Stop motion, switch the servo off and release the camera; safe to call more than once"""
         # Clear any button states
         self.button_states.clear()
+
+        # Stop the motion thread before the servo is switched off
+        if hasattr(self, '_motion_thread'):
+            self._motion_stop.set()
+            self._motion_wake.set()
+            self._motion_thread.join(timeout=1)
         
         # Turn off the servo
-        if hasattr(self, 'pi') and self.pi.connected:
-            self.pi.set_servo_pulsewidth(self.GRIPPER_PIN, 0)
+        if self.pi is not None and self.pi.connected:
+            self.pi.set_servo_pulsewidth(GRIPPER_PIN, 0)
             self.pi.stop()
+            self.pi = None
             
-        # Release camera
-        try:
-            if hasattr(self, 'cap') and self.cap is not None:
-                self.cap.release()
-        except Exception as e:
-            print(f"Error releasing camera: {e}")
+        # Stop the grab thread; it releases the camera as it exits
+        self._stop_grab_thread()
 
 if __name__ == "__main__":
+    # --no-servo shows the GUI and camera without pigpio or the gripper attached
+    use_servo = "--no-servo" not in sys.argv[1:]
+
     # Check if pigpio daemon is running
-    try:
-        pi_test = pigpio.pi()
-        if not pi_test.connected:
-            print("Error: pigpiod daemon is not running.")
-            print("Start it with: sudo pigpiod")
+    if use_servo:
+        try:
+            pi_test = pigpio.pi()
+            if not pi_test.connected:
+                print("Error: pigpiod daemon is not running.")
+                print("Start it with: sudo pigpiod -m")
+                exit(1)
+            pi_test.stop()
+        except:
+            print("Error connecting to pigpio daemon.")
+            print("Make sure it's installed and running with: sudo pigpiod -m")
+            print("Or run without the servo: python gripperCon.py --no-servo")
             exit(1)
-        pi_test.stop()
-    except:
-        print("Error connecting to pigpio daemon.")
-        print("Make sure it's installed and running with: sudo pigpiod")
-        exit(1)
-        
+
+    # Keep Tk and the camera thread (which inherits this affinity) off the motion core
+    try:
+        other_cpus = os.sched_getaffinity(0) - {MOTION_CPU}
+        if other_cpus:
+            os.sched_setaffinity(0, other_cpus)
+    except (AttributeError, OSError) as e:
+        print(f"Could not move GUI off CPU {MOTION_CPU}: {e}")
+
     # Start GUI
     root = tk.Tk()
-    app = RoboticArmGUI(root)
+    app = RoboticArmGUI(root, use_servo=use_servo)
     
+    shutting_down = False
+
+    def shutdown():
+        global shutting_down
+        if shutting_down:
+            return
+        shutting_down = True
+        app.cleanup()
+        root.destroy()
+
+    def on_signal(signum, frame):
+        # Python runs this inside whichever Tk callback is dispatched next, so only
+        # queue the shutdown and let Tk run it once that callback has finished
+        if not shutting_down:
+            root.after_idle(shutdown)
+
     # Close camera and GPIO properly when window is closed
-    root.protocol("WM_DELETE_WINDOW", lambda: [app.cleanup(), root.destroy()])
+    root.protocol("WM_DELETE_WINDOW", shutdown)
+
+    # Also switch the servo off on Ctrl-C, kill, or any other interpreter exit,
+    # so it is never left holding its last position
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+    atexit.register(app.cleanup)
     
     root.mainloop()
\ No newline at end of file
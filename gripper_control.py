@@ -9,6 +9,14 @@ GRIPPER_PIN = 17
 OPEN_PW = 2000   # Pulse width for open position (?s)
 CLOSED_PW = 1000  # Pulse width for closed position (?s)
 SPEED = 3.0      # Movement duration in seconds
+MIDDLE_PW = 1500  # Pulse width for middle position (?s)
+
+# Key -> (message, target pulse width)
+KEY_TARGETS = {
+    'o': ("Opening gripper...", OPEN_PW),
+    'c': ("Closing gripper...", CLOSED_PW),
+    'm': ("Moving to middle position...", MIDDLE_PW),
+}
 
 # Connect to pigpio daemon
 pi = pigpio.pi()
@@ -27,16 +35,10 @@ def getch():
         termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     return ch
 
-def get_current_pw(pin):
-    """Get current pulse width or return middle position if servo is off"""
-    current_pw = pi.get_servo_pulsewidth(pin)
-    if current_pw == 0:  # If servo is off
-        return 1500  # Return middle position
-    return current_pw
-
 try:
     # Set gripper to middle position initially
-    pi.set_servo_pulsewidth(GRIPPER_PIN, 1500)
+    pi.set_servo_pulsewidth(GRIPPER_PIN, MIDDLE_PW)
+    current_pw = MIDDLE_PW
     time.sleep(1)
     
     print("\nGripper Control Ready!")
@@ -47,35 +49,27 @@ try:
     print("---------------------")
     
     while True:
-        # Get current position
-        current_pw = get_current_pw(GRIPPER_PIN)
-        
         # Get key press non-blocking
         key = getch()
         
-        if key == 'o':
-            # Open gripper with a single movement
-            print("Opening gripper...")
-            target_pw = OPEN_PW
-            pi.set_servo_pulsewidth(GRIPPER_PIN, target_pw)
-            print(f"Gripper at: {target_pw}?s")
+        if key == 'q':
+            print("\nExiting program...")
+            break
+        
+        # Move the gripper straight to the target for this key
+        target = KEY_TARGETS.get(key)
+        if target is not None:
+            message, target_pw = target
+            
+            # Skip the command when the gripper is already there
+            if target_pw == current_pw:
+                print(f"Gripper already at: {target_pw}?s")
+                continue
             
-        elif key == 'c':
-            # Close gripper with a single movement
-            print("Closing gripper...")
-            target_pw = CLOSED_PW
+            print(message)
             pi.set_servo_pulsewidth(GRIPPER_PIN, target_pw)
+            current_pw = target_pw
             print(f"Gripper at: {target_pw}?s")
-            
-        elif key == 'm':
-            # Move to middle position
-            print("Moving to middle position...")
-            pi.set_servo_pulsewidth(GRIPPER_PIN, 1500)
-            print("Gripper at middle position")
-            
-        elif key == 'q':
-            print("\nExiting program...")
-            break
     
 except KeyboardInterrupt:
     print("\nProgram interrupted")
@@ -3,12 +3,28 @@ import time
 
 SERVO_PIN = 17
 
+# pigpio script that steps a servo inside the daemon
+# Params: p0 pin, p1 start pw, p2 end pw, p3 steps, p4 delay between steps (ms)
+SWEEP_SCRIPT = (b"lda p2 sub p1 div p3 sta v1 "  # v1 = increment per step
+                b"ld v0 p1 ld v2 p3 "  # v0 = pulse width, v2 = steps left
+                b"tag 0 servo p0 v0 mils p4 lda v0 add v1 sta v0 dcr v2 jp 0 "
+                b"servo p0 p2")  # Land exactly on the end position
+
 # Connect to pigpio daemon
 pi = pigpio.pi()
 if not pi.connected:
     print("Failed to connect to pigpio daemon!")
     exit()
 
+# Upload the sweep once so each move is a single request to pigpiod
+try:
+    sweep_script = pi.store_script(SWEEP_SCRIPT)
+    while pi.script_status(sweep_script)[0] == pigpio.PI_SCRIPT_INITING:
+        time.sleep(0.01)
+except pigpio.error as e:
+    print(f"Sweep script unavailable ({e}), stepping from Python instead")
+    sweep_script = None
+
 def move_servo_slowly(pin, start_pw, end_pw, duration=2.0):
     """
     Move servo slowly from start position to end position
@@ -25,11 +41,26 @@ def move_servo_slowly(pin, start_pw, end_pw, duration=2.0):
     
     print(f"Moving servo on pin {pin} slowly from {start_pw}us to {end_pw}us...")
     
-    # Move in small increments
-    for i in range(steps + 1):
-        pulse_width = start_pw + (step_size * i)
-        pi.set_servo_pulsewidth(pin, pulse_width)
-        time.sleep(delay)
+    # Let the daemon do the stepping and just wait for it to finish
+    if sweep_script is not None:
+        pi.run_script(sweep_script, [pin, int(start_pw), int(end_pw), steps, int(delay * 1000)])
+        while pi.script_status(sweep_script)[0] not in (pigpio.PI_SCRIPT_HALTED, pigpio.PI_SCRIPT_FAILED):
+            time.sleep(0.05)
+        return
+    
+    # Precompute the whole trajectory once so the loop only streams it out
+    pulse_widths = [int(start_pw + step_size * i) for i in range(steps + 1)]
+    set_pw = pi.set_servo_pulsewidth
+    
+    # Move in small increments, sleeping to absolute deadlines so the
+    # time spent on each pigpio call doesn't add up over the move
+    next_t = time.monotonic()
+    for pulse_width in pulse_widths:
+        set_pw(pin, pulse_width)
+        next_t += delay
+        remaining = next_t - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
 
 try:
     # Move slowly from 0 degree to 90 degree
@@ -46,5 +77,8 @@ except KeyboardInterrupt:
     print("Program interrupted")
     
 finally:
+    if sweep_script is not None:
+        pi.stop_script(sweep_script)
+        pi.delete_script(sweep_script)
     pi.stop()
     print("Test completed")